@@ -17,13 +17,21 @@ Requires:
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import json
 import os
+import random
+import time
 from typing import Optional, Dict, Any
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 # Google Tasks scope (full access to your Tasks)
 SCOPES = ["https://www.googleapis.com/auth/tasks"]
@@ -31,11 +39,111 @@ SCOPES = ["https://www.googleapis.com/auth/tasks"]
 # Name of the task list to create/use
 TASKLIST_NAME = "60 Day Hard"
 
-
+# On-disk {name: id} cache so repeat runs skip the tasklists().list() call
+TASKLIST_CACHE_FILE = "tasklist_cache.json"
+
+# On-disk httplib2 response cache (discovery documents etc.)
+HTTP_CACHE_DIR = ".httpcache"
+
+# Google batch endpoints accept at most 1000 calls per batch request.
+BATCH_LIMIT = 1000
+
+# Transient statuses worth retrying with backoff (rate limit / server errors)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Task notes, built once at import instead of on every loop iteration.
+DAILY_NOTES = "\n".join(
+    [
+        "No alcohol",
+        "No recreational drugs",
+        "2L water",
+        "5 min meditation and RLT",
+        "Reading before bed",
+    ]
+)
+
+MON_NOTES = "\n".join(
+    [
+        "20–25 min cardio",
+        "Push-ups: 3×12",
+        "Pull-ups (assisted): 3×8 (2–3s hold)",
+        "Step-ups: 3×10/leg",
+        "Leg raises: 3×10",
+        "Stretch",
+    ]
+)
+
+TUE_NOTES = "\n".join(
+    [
+        "4–6 routes",
+        "Technique warm-up",
+        "Shoulder mobility",
+    ]
+)
+
+WED_NOTES = "\n".join(
+    [
+        "25 min cardio",
+        "Push-ups: 3×12",
+        "Pull-ups: 3×8",
+        "Step-ups: 3×10/leg",
+        "Leg raises: 3×10",
+        "Stretch",
+    ]
+)
+
+THU_A_NOTES = "\n".join(
+    [
+        "4–6 routes",
+        "Technique focus",
+        "Mobility cool-down",
+    ]
+)
+
+THU_B_NOTES = "\n".join(
+    [
+        "750–1000m total",
+        "4×50 warm-up",
+        "6×50 drills",
+        "4×100 easy",
+        "2×50 cooldown",
+    ]
+)
+
+FRI_NOTES = "\n".join(
+    [
+        "20 min cardio",
+        "Push-ups: 3×10–12",
+        "Pull-ups: 3×6–8",
+        "Split squats or step-ups: 3×8/leg",
+        "Core circuit ×3",
+        "Stretch",
+    ]
+)
+
+# Daily walk per Python weekday (Monday = 0 ... Sunday = 6):
+# Sundays get the long walk, every other day the 30-minute walk.
+WALK_TITLES = ["60DH – 30-min Walk"] * 6 + ["60DH – Long Walk (45–60 min)"]
+
+# Day-specific workout per Python weekday (Monday = 0 ... Sunday = 6).
+# Thursday alternates: Week A climbs, Week B swims (handled in main()).
+DAY_TASKS = {
+    0: ("Strength – Full Body / Lower", MON_NOTES),
+    1: ("Climbing Session", TUE_NOTES),
+    2: ("Strength – Signature Workout", WED_NOTES),
+    3: ("Climbing Session (Week A)", THU_A_NOTES),
+    4: ("Strength – Full Body + Core", FRI_NOTES),
+    5: ("Yoga – 1 Hour", None),
+    6: ("Mobility / Recovery", None),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_service():
     """
     Authenticate and return a Google Tasks API service client.
     Looks for token.json and credentials.json in the current working directory.
+    The result is cached, so repeat calls skip the token-file I/O and build().
     """
     creds: Optional[Credentials] = None
 
@@ -59,22 +167,80 @@ def get_service():
         with open("token.json", "w") as token:
             token.write(creds.to_json())
 
-    return build("tasks", "v1", credentials=creds)
+    def build_request(http, *args, **kwargs):
+        # httplib2.Http is not thread-safe, so give every request its own
+        # authorized Http instance instead of sharing the service's default.
+        new_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        return HttpRequest(new_http, *args, **kwargs)
+
+    # static_discovery uses the discovery document bundled with the client
+    # library instead of fetching it over the network on every build(), and
+    # the on-disk httplib2 cache catches anything that does go over the wire
+    # (e.g. discovery on library versions without a bundled document).
+    http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(cache=HTTP_CACHE_DIR)
+    )
+    return build(
+        "tasks",
+        "v1",
+        http=http,
+        requestBuilder=build_request,
+        static_discovery=True,
+    )
+
+
+def _read_tasklist_cache() -> Dict[str, str]:
+    try:
+        with open(TASKLIST_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
+def _write_tasklist_cache(cache: Dict[str, str]) -> None:
+    try:
+        with open(TASKLIST_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # cache is best-effort; losing it only costs a list() call
+
+
+def invalidate_tasklist_cache(name: str) -> None:
+    """
+    Drop a cached tasklist ID (e.g. after the API returns 404 for it) so the
+    next lookup goes back to the API.
+    """
+    cache = _read_tasklist_cache()
+    if cache.pop(name, None) is not None:
+        _write_tasklist_cache(cache)
+    get_or_create_tasklist.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
 def get_or_create_tasklist(service, name: str) -> Dict[str, Any]:
     """
     Find an existing task list by title, or create it if it doesn't exist.
+    The resolved ID is cached in TASKLIST_CACHE_FILE, so repeat runs skip the
+    list() round trip entirely; a stale cached ID is handled in main() by
+    invalidating the cache and retrying when inserts come back 404.
     """
+    cache = _read_tasklist_cache()
+    if name in cache:
+        return {"id": cache[name], "title": name}
+
     result = service.tasklists().list().execute()
     items = result.get("items", []) or []
 
     for lst in items:
         if lst.get("title") == name:
-            return lst
+            break
+    else:
+        body = {"title": name}
+        lst = service.tasklists().insert(body=body).execute()
 
-    body = {"title": name}
-    return service.tasklists().insert(body=body).execute()
+    cache[name] = lst["id"]
+    _write_tasklist_cache(cache)
+    return lst
 
 
 def make_due_iso(date_obj: dt.date) -> str:
@@ -82,17 +248,10 @@ def make_due_iso(date_obj: dt.date) -> str:
     Convert a date to an RFC3339 "due" string at noon UTC.
     Google Tasks due dates are datetime strings in RFC3339 format.
     """
-    dt_noon = dt.datetime(
-        year=date_obj.year,
-        month=date_obj.month,
-        day=date_obj.day,
-        hour=12,
-        minute=0,
-        second=0,
-        tzinfo=dt.timezone.utc,
-    )
+    # The time portion is always noon UTC, so format directly instead of
+    # building a datetime and round-tripping through isoformat()/replace().
     # Example: 2026-01-05T12:00:00Z
-    return dt_noon.isoformat().replace("+00:00", "Z")
+    return f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}T12:00:00Z"
 
 
 def create_task(
@@ -103,7 +262,9 @@ def create_task(
     due: Optional[str] = None,
 ):
     """
-    Create a single task in the specified task list.
+    Build an (unexecuted) insert request for a single task in the specified
+    task list. The caller is responsible for executing it, normally by adding
+    it to a batch via execute_in_batches().
     """
     body: Dict[str, Any] = {"title": title}
     if notes:
@@ -111,10 +272,119 @@ def create_task(
     if due:
         body["due"] = due
 
-    return service.tasks().insert(tasklist=tasklist_id, body=body).execute()
+    return service.tasks().insert(tasklist=tasklist_id, body=body)
+
+
+def execute_in_batches(service, requests, max_retries: int = 5):
+    """
+    Execute a list of API requests using batch HTTP requests, chunked at the
+    1000-call batch limit. Calls that fail with a transient status (429/5xx)
+    are resubmitted in a follow-up batch with exponential backoff, so one
+    rate-limit blip doesn't abort (or force a duplicate re-run of) the whole
+    program. Returns a list of (request_id, exception) pairs for calls that
+    still failed after all retries.
+    """
+    pending = {str(i): request for i, request in enumerate(requests)}
+    errors = []
+
+    for attempt in range(max_retries + 1):
+        if not pending:
+            break
+        if attempt:
+            # Exponential backoff with jitter before resubmitting failures.
+            time.sleep(2 ** (attempt - 1) + random.random())
+
+        failed: Dict[str, Exception] = {}
+
+        def on_insert(request_id, response, exception, _failed=failed):
+            if exception is not None:
+                _failed[request_id] = exception
+
+        items = list(pending.items())
+        for start in range(0, len(items), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_insert)
+            for request_id, request in items[start : start + BATCH_LIMIT]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+
+        retry = {}
+        for request_id, exception in failed.items():
+            if (
+                attempt < max_retries
+                and isinstance(exception, HttpError)
+                and exception.resp.status in RETRYABLE_STATUSES
+            ):
+                retry[request_id] = pending[request_id]
+            else:
+                errors.append((request_id, exception))
+        pending = retry
+
+    return errors
+
+
+def list_existing_task_keys(service, tasklist_id: str):
+    """
+    Return the set of (title, due date) pairs already present in the task
+    list, paging through tasks().list(). Due dates are truncated to
+    YYYY-MM-DD so they compare cleanly against make_due_iso() output.
+    """
+    seen = set()
+    page_token = None
+
+    while True:
+        result = (
+            service.tasks()
+            .list(
+                tasklist=tasklist_id,
+                maxResults=100,  # the Tasks API caps pages at 100 items
+                showCompleted=True,
+                showHidden=True,
+                pageToken=page_token,
+            )
+            .execute()
+        )
+        for task in result.get("items", []) or []:
+            seen.add((task.get("title"), (task.get("due") or "")[:10]))
+
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return seen
+
+
+def build_plan(start_date: dt.date, num_days: int):
+    """
+    Precompute the whole program as data: one list of (title, notes, due)
+    tuples per day. Each day gets the daily-habits task, the daily walk
+    (long walk on Sundays), and the weekday workout from DAY_TASKS, with
+    Thursdays alternating climb (Week A) and swim (Week B).
+
+    Keeping the plan as plain tuples means the insert loop has no branching
+    and the tasks can be fed straight into a batch request.
+    """
+    plan = []
+    for i in range(num_days):
+        current_date = start_date + dt.timedelta(days=i)
+        # Python: Monday = 0, Sunday = 6
+        dow = current_date.weekday()
+        is_week_a = (i // 7) % 2 == 0
+
+        due = make_due_iso(current_date)
+
+        title, notes = DAY_TASKS[dow]
+        if dow == 3 and not is_week_a:
+            title, notes = "Swim Session (Week B)", THU_B_NOTES
+
+        plan.append(
+            [
+                ("60DH – Daily Habits", DAILY_NOTES, due),
+                (WALK_TITLES[dow], None, due),
+                (title, notes, due),
+            ]
+        )
+    return plan
 
 
-def main():
+def main(_retry_on_stale_tasklist: bool = True):
     """
     Main entrypoint: create all tasks for the 60 Day Hard program.
     Mirrors the original JS logic:
@@ -135,175 +405,44 @@ def main():
     start_date = dt.date(2026, 1, 5)
     num_days = 60
 
-    for i in range(num_days):
-        current_date = start_date + dt.timedelta(days=i)
-        # Python: Monday = 0, Sunday = 6
-        dow = current_date.weekday()
-        week_index = i // 7
-        is_week_a = (week_index % 2 == 0)
-
-        due = make_due_iso(current_date)
-
-        # === DAILY HABITS TASK ===
-        daily_notes = "\n".join(
-            [
-                "No alcohol",
-                "No recreational drugs",
-                "2L water",
-                "5 min meditation and RLT",
-                "Reading before bed",
-            ]
-        )
-        create_task(
-            service,
-            tasklist_id,
-            title="60DH – Daily Habits",
-            notes=daily_notes,
-            due=due,
+    # Build the program once as data, then turn it into unexecuted insert
+    # requests so the whole thing goes out in a handful of batch HTTP calls.
+    # Tasks whose (title, due date) already exist are skipped, so re-running
+    # the script only inserts what's missing instead of duplicating all 60
+    # days.
+    plan = build_plan(start_date, num_days)
+    try:
+        seen = list_existing_task_keys(service, tasklist_id)
+    except HttpError as exc:
+        # A stale cached tasklist ID 404s here, before any insert goes out.
+        if _retry_on_stale_tasklist and exc.resp.status == 404:
+            invalidate_tasklist_cache(TASKLIST_NAME)
+            return main(_retry_on_stale_tasklist=False)
+        raise
+    requests = [
+        create_task(service, tasklist_id, title=title, notes=notes, due=due)
+        for day in plan
+        for title, notes, due in day
+        if (title, due[:10]) not in seen
+    ]
+
+    errors = execute_in_batches(service, requests)
+
+    # A cached tasklist ID can go stale if the list was deleted; every insert
+    # then 404s. Invalidate the cache and retry once from scratch.
+    if (
+        _retry_on_stale_tasklist
+        and errors
+        and all(
+            isinstance(exception, HttpError) and exception.resp.status == 404
+            for _, exception in errors
         )
+    ):
+        invalidate_tasklist_cache(TASKLIST_NAME)
+        return main(_retry_on_stale_tasklist=False)
 
-        # === DAILY WALK ===
-        # In original JS: Sunday (0) = long walk. Here, Sunday is dow == 6.
-        if dow == 6:
-            walk_title = "60DH – Long Walk (45–60 min)"
-        else:
-            walk_title = "60DH – 30-min Walk"
-
-        create_task(service, tasklist_id, title=walk_title, due=due)
-
-        # === DAY-SPECIFIC WORKOUTS ===
-        # Map original JS getDay() cases to Python weekday():
-        # JS: 1 = Mon → Python: 0
-        # JS: 2 = Tue → Python: 1
-        # JS: 3 = Wed → Python: 2
-        # JS: 4 = Thu → Python: 3
-        # JS: 5 = Fri → Python: 4
-        # JS: 6 = Sat → Python: 5
-        # JS: 0 = Sun → Python: 6
-
-        if dow == 0:  # MONDAY – Strength – Full Body / Lower
-            notes = "\n".join(
-                [
-                    "20–25 min cardio",
-                    "Push-ups: 3×12",
-                    "Pull-ups (assisted): 3×8 (2–3s hold)",
-                    "Step-ups: 3×10/leg",
-                    "Leg raises: 3×10",
-                    "Stretch",
-                ]
-            )
-            create_task(
-                service,
-                tasklist_id,
-                title="Strength – Full Body / Lower",
-                notes=notes,
-                due=due,
-            )
-
-        elif dow == 1:  # TUESDAY – Climb
-            notes = "\n".join(
-                [
-                    "4–6 routes",
-                    "Technique warm-up",
-                    "Shoulder mobility",
-                ]
-            )
-            create_task(
-                service,
-                tasklist_id,
-                title="Climbing Session",
-                notes=notes,
-                due=due,
-            )
-
-        elif dow == 2:  # WEDNESDAY – Signature Strength
-            notes = "\n".join(
-                [
-                    "25 min cardio",
-                    "Push-ups: 3×12",
-                    "Pull-ups: 3×8",
-                    "Step-ups: 3×10/leg",
-                    "Leg raises: 3×10",
-                    "Stretch",
-                ]
-            )
-            create_task(
-                service,
-                tasklist_id,
-                title="Strength – Signature Workout",
-                notes=notes,
-                due=due,
-            )
-
-        elif dow == 3:  # THURSDAY — Week A = Climb, Week B = Swim
-            if is_week_a:
-                notes = "\n".join(
-                    [
-                        "4–6 routes",
-                        "Technique focus",
-                        "Mobility cool-down",
-                    ]
-                )
-                create_task(
-                    service,
-                    tasklist_id,
-                    title="Climbing Session (Week A)",
-                    notes=notes,
-                    due=due,
-                )
-            else:
-                notes = "\n".join(
-                    [
-                        "750–1000m total",
-                        "4×50 warm-up",
-                        "6×50 drills",
-                        "4×100 easy",
-                        "2×50 cooldown",
-                    ]
-                )
-                create_task(
-                    service,
-                    tasklist_id,
-                    title="Swim Session (Week B)",
-                    notes=notes,
-                    due=due,
-                )
-
-        elif dow == 4:  # FRIDAY – Strength + Core
-            notes = "\n".join(
-                [
-                    "20 min cardio",
-                    "Push-ups: 3×10–12",
-                    "Pull-ups: 3×6–8",
-                    "Split squats or step-ups: 3×8/leg",
-                    "Core circuit ×3",
-                    "Stretch",
-                ]
-            )
-            create_task(
-                service,
-                tasklist_id,
-                title="Strength – Full Body + Core",
-                notes=notes,
-                due=due,
-            )
-
-        elif dow == 5:  # SATURDAY – Yoga
-            create_task(
-                service,
-                tasklist_id,
-                title="Yoga – 1 Hour",
-                due=due,
-            )
-
-        # SUNDAY – Active Recovery (Mobility / Recovery)
-        if dow == 6:
-            create_task(
-                service,
-                tasklist_id,
-                title="Mobility / Recovery",
-                due=due,
-            )
+    for request_id, exception in errors:
+        print(f"Insert {request_id} failed: {exception}")
 
 
 if __name__ == "__main__":